@@ -6,34 +6,52 @@
 
 import json
 import sys
-from colorama import Fore, Style
+from functools import lru_cache
 
 from ..core.state_manager import StateManager
 from ..core.question_generator import QuestionGenerator
-from ..ui.menu import MenuSystem
-from ..utils.paths import get_data_file_path, ensure_app_dirs_exist
+from ..utils.paths import PATHS, ensure_app_dirs_exist
 
+def _print_error(message: str) -> None:
+    """Print an error message in red.
+    
+    The UI modules that normally initialize colorama are imported lazily, so
+    an error can be reported before they have loaded. Initializing colorama
+    here keeps that output colored correctly on every platform.
+    
+    Args:
+        message: Error text to display
+    """
+    from colorama import Fore, Style, init
+    init(autoreset=True)
+    print(f"{Fore.RED}{message}{Style.RESET_ALL}")
+
+@lru_cache(maxsize=1)
 def load_port_data() -> dict:
     """Load and validate port configuration data from JSON file.
     
     Attempts to load the port data configuration file and validates its structure.
     Handles common failure cases with user-friendly error messages.
     
+    The parsed result is cached, so repeated calls within the same process
+    return the same dictionary without touching the file again. The file is
+    read as raw bytes and handed straight to the parser, skipping the text
+    decoding layer.
+    
     Returns:
         dict: Structured port information including names, codes, and metadata
     
     Raises:
         SystemExit: If the data file is missing or contains invalid JSON
     """
-    data_file = get_data_file_path()
+    data_file = PATHS.data
     try:
-        with data_file.open('r') as f:
-            return json.load(f)
+        return json.loads(data_file.read_bytes())
     except FileNotFoundError:
-        print(f"{Fore.RED}Error: ports.json not found. Please ensure the data file exists at {data_file}{Style.RESET_ALL}")
+        _print_error(f"Error: ports.json not found. Please ensure the data file exists at {data_file}")
         sys.exit(1)
-    except json.JSONDecodeError:
-        print(f"{Fore.RED}Error: ports.json is corrupted or invalid.{Style.RESET_ALL}")
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        _print_error("Error: ports.json is corrupted or invalid.")
         sys.exit(1)
 
 def main() -> None:
@@ -59,12 +77,13 @@ def main() -> None:
         state_manager = StateManager()
         question_gen = QuestionGenerator(port_info)
         
-        # Create and run menu system
+        # Create and run menu system; the UI stack is only loaded once needed
+        from ..ui.menu import MenuSystem
         menu = MenuSystem(port_info, state_manager, question_gen)
         menu.main_menu()
         
     except Exception as e:
-        print(f"{Fore.RED}An unexpected error occurred: {e}{Style.RESET_ALL}")
+        _print_error(f"An unexpected error occurred: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
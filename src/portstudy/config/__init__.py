@@ -6,21 +6,29 @@
 
 from .settings import (
     LEVEL_REQUIREMENTS,
+    MAX_LEVEL,
     QUESTION_CHOICES,
     REDEMPTION_CHANCE,
+    AUTOSAVE_INTERVAL,
+    SAVE_FLUSH_TIMEOUT,
     ASCII_ART,
     MENU_OPTIONS,
-    ACCURACY_COLOR_THRESHOLDS
+    ACCURACY_COLOR_THRESHOLDS,
+    ACCURACY_COLOR_LUT
 )
 
 __all__ = [
     'LEVEL_REQUIREMENTS',
+    'MAX_LEVEL',
     'QUESTION_CHOICES',
     'REDEMPTION_CHANCE',
+    'AUTOSAVE_INTERVAL',
+    'SAVE_FLUSH_TIMEOUT',
     'QUESTION_TYPE_WEIGHTS',
     'PORT_DIFFICULTY_WEIGHTS',
     'SAVE_INTEGRITY_KEYS',
     'ASCII_ART',
     'MENU_OPTIONS',
-    'ACCURACY_COLOR_THRESHOLDS'
+    'ACCURACY_COLOR_THRESHOLDS',
+    'ACCURACY_COLOR_LUT'
 ]
\ No newline at end of file
@@ -4,7 +4,7 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 # Level progression requirements - now includes level 5
 LEVEL_REQUIREMENTS: Dict[int, Dict[str, Optional[int]]] = {
@@ -15,10 +15,20 @@ LEVEL_REQUIREMENTS: Dict[int, Dict[str, Optional[int]]] = {
     5: {"accuracy": None, "streak": None, "window": None}  # Max level
 }
 
+# Highest difficulty level, computed once instead of on every check
+MAX_LEVEL = max(LEVEL_REQUIREMENTS.keys())
+
 # Question generation settings
 QUESTION_CHOICES = 4
 REDEMPTION_CHANCE = 0.5  # 50% chance for redemption questions
 
+# Number of answered questions between automatic saves; level changes and
+# exiting always save immediately
+AUTOSAVE_INTERVAL = 10
+
+# Seconds to wait for queued saves to reach disk when exiting
+SAVE_FLUSH_TIMEOUT = 5
+
 # Question type weights (higher number = more frequent)
 QUESTION_TYPE_WEIGHTS = {
     "standard": 80,  # Regular multiple choice questions
@@ -64,4 +74,11 @@ ACCURACY_COLOR_THRESHOLDS = [
     (70, "YELLOW"),
     (60, "LIGHTYELLOW_EX"),
     (0, "RED")
-]
\ No newline at end of file
+]
+
+# Color name for every whole accuracy percentage (0-100), derived from the
+# thresholds above so lookups are a single index instead of a scan
+ACCURACY_COLOR_LUT: Tuple[str, ...] = tuple(
+    next((color for threshold, color in ACCURACY_COLOR_THRESHOLDS if pct >= threshold), "RED")
+    for pct in range(101)
+)
\ No newline at end of file
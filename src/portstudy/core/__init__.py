@@ -4,11 +4,13 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+from .accuracy_window import AccuracyWindow
 from .game_state import GameState
 from .state_manager import StateManager
 from .question_generator import QuestionGenerator
 
 __all__ = [
+    'AccuracyWindow',
     'GameState',
     'StateManager',
     'QuestionGenerator'
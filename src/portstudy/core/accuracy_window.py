@@ -0,0 +1,111 @@
+"""Sliding window of answer results stored as an integer bitfield."""
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from typing import Iterable, Iterator
+
+class AccuracyWindow:
+    """Fixed-size sliding window of correct/incorrect results.
+    
+    Behaves like a deque(maxlen=...) of booleans, but packs the results
+    one bit per answer into a single integer. The newest result occupies the
+    least significant bit, so appending is a shift and a mask, and results
+    that fall out of the window are simply masked away.
+    
+    Because the oldest result sits in the most significant used bit, the
+    packed value can be written to save data directly without reordering.
+    A running count of correct results is kept up to date on every append,
+    so accuracy queries never have to scan the window.
+    
+    Attributes:
+        maxlen (int): Maximum number of results held in the window
+        bits (int): Packed results, oldest in the highest used bit
+    """
+    
+    __slots__ = ("maxlen", "bits", "_length", "_mask", "_correct")
+    
+    def __init__(self, results: Iterable[bool] = (), *, maxlen: int) -> None:
+        """
+        Initialize the window, optionally seeding it with existing results.
+        
+        Args:
+            results: Results to append in order, oldest first
+            maxlen: Maximum number of results to keep
+        """
+        self.maxlen = maxlen
+        self.bits = 0
+        self._length = 0
+        self._correct = 0
+        self._mask = (1 << maxlen) - 1
+        for result in results:
+            self.append(result)
+    
+    @classmethod
+    def from_bits(cls, bits: int, length: int, *, maxlen: int) -> "AccuracyWindow":
+        """
+        Create a window directly from packed results.
+        
+        As with a deque, only the newest maxlen results are kept when more
+        are supplied.
+        
+        Args:
+            bits: Packed results, oldest in the highest used bit
+            length: Number of results packed into bits
+            maxlen: Maximum number of results to keep
+        
+        Returns:
+            New window holding the given results
+        """
+        window = cls(maxlen=maxlen)
+        window._length = min(length, maxlen)
+        window.bits = bits & ((1 << window._length) - 1)
+        window._correct = bin(window.bits).count("1")
+        return window
+    
+    def append(self, correct: bool) -> None:
+        """
+        Add a result, discarding the oldest one if the window is full.
+        
+        Args:
+            correct: Whether the answer was correct
+        """
+        if self._length < self.maxlen:
+            self._length += 1
+        else:
+            # The oldest result is about to be shifted out of the window
+            self._correct -= (self.bits >> (self.maxlen - 1)) & 1
+        
+        if correct:
+            self._correct += 1
+        self.bits = ((self.bits << 1) | (1 if correct else 0)) & self._mask
+    
+    def clear(self) -> None:
+        """Remove all results from the window."""
+        self.bits = 0
+        self._length = 0
+        self._correct = 0
+    
+    @property
+    def correct_count(self) -> int:
+        """Number of correct results currently in the window."""
+        return self._correct
+    
+    @property
+    def accuracy_percent(self) -> float:
+        """Percentage of correct results in the window, or 0 if it is empty."""
+        if not self._length:
+            return 0.0
+        return (self._correct / self._length) * 100
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self) -> Iterator[bool]:
+        bits = self.bits
+        for shift in range(self._length - 1, -1, -1):
+            yield (bits >> shift) & 1 == 1
+    
+    def __repr__(self) -> str:
+        return f"AccuracyWindow({list(self)!r}, maxlen={self.maxlen})"
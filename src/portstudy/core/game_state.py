@@ -11,19 +11,73 @@ The save data format uses a compact binary structure:
     - n bytes: Bitfield data padded to byte boundary
 
 The entire binary structure is then base64 encoded for storage.
+
+Format version 2 computes the checksum with CRC-16/CCITT-FALSE. Version 1
+saves used the lower 16 bits of a CRC32 instead and are still accepted on load.
 """
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-import base64
-from typing import Dict, List, Deque, Any
-from collections import deque
+import binascii
+import struct
+from typing import Dict, Any, NamedTuple, Tuple, Union
 from datetime import datetime
 import zlib
 
-from ..config.settings import SAVE_INTEGRITY_KEYS, LEVEL_REQUIREMENTS
+from ..config.settings import SAVE_INTEGRITY_KEYS, MAX_LEVEL
+from .accuracy_window import AccuracyWindow
+
+# Save record header: checksum, data length, null separator
+_HEADER = struct.Struct('>HHB')
+
+# CRC-16/CCITT-FALSE parameters
+_CRC16_POLY = 0x1021
+_CRC16_INIT = 0xFFFF
+
+def _build_crc16_nibble_table(poly: int) -> Tuple[int, ...]:
+    """Precompute the CRC16 remainder for each of the 16 possible nibbles."""
+    table = []
+    for nibble in range(16):
+        crc = nibble << 12
+        for _ in range(4):
+            crc = (crc << 1) ^ poly if crc & 0x8000 else crc << 1
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
+_CRC16_NIBBLE = _build_crc16_nibble_table(_CRC16_POLY)
+
+def _crc16(data: Union[bytes, memoryview]) -> int:
+    """Compute a CRC-16/CCITT-FALSE checksum using a 16-entry nibble table.
+    
+    Save payloads are only a handful of bytes, so processing each byte as two
+    table lookups keeps the per-call work small without a 256-entry table.
+    
+    Args:
+        data: Raw bytes to checksum
+        
+    Returns:
+        16-bit CRC value
+    """
+    table = _CRC16_NIBBLE
+    crc = _CRC16_INIT
+    for byte in data:
+        crc = table[((crc >> 12) ^ (byte >> 4)) & 0xF] ^ ((crc << 4) & 0xFFFF)
+        crc = table[((crc >> 12) ^ byte) & 0xF] ^ ((crc << 4) & 0xFFFF)
+    return crc
+
+class StateSnapshot(NamedTuple):
+    """Point-in-time copy of the values needed to serialize a GameState.
+    
+    All fields are immutable, so a snapshot can be serialized safely while the
+    live game state keeps changing.
+    """
+    timestamp: datetime
+    difficulty: int
+    accuracy_bits: int
+    accuracy_length: int
+    streak_length: int
 
 class GameState:
     """Manages game state data with serialization and integrity protection.
@@ -37,43 +91,49 @@ class GameState:
     
     Attributes:
         FORMAT_VERSION (int): Version identifier for save data format
+        MIN_FORMAT_VERSION (int): Oldest save data format that can still be loaded
         current_difficulty (int): Current difficulty level of the game
-        accuracy_window (Deque[bool]): Recent accuracy history as sliding window
-        streak_window (List[bool]): Current streak of correct answers
+        accuracy_window (AccuracyWindow): Recent accuracy history as sliding window
+        streak_count (int): Number of consecutive qualifying correct answers
     """
     
-    FORMAT_VERSION = 1
+    FORMAT_VERSION = 2
+    MIN_FORMAT_VERSION = 1
     
     def __init__(self) -> None:
         """Initialize a new game state with default values."""
         self.current_difficulty: int = 1
-        self.accuracy_window: Deque[bool] = deque(maxlen=30)
-        self.streak_window: List[bool] = []
+        self.accuracy_window: AccuracyWindow = AccuracyWindow(maxlen=30)
+        self.streak_count: int = 0
     
     @staticmethod
-    def _compute_checksum(data: bytes, key: int) -> int:
+    def _compute_checksum(data: Union[bytes, memoryview], key: int, version: int = FORMAT_VERSION) -> int:
         """Compute a tamper-resistant checksum for save data.
         
-        Calculates a CRC16 checksum (derived from CRC32) and XORs it with a
-        type-specific key to prevent data reuse between different save fields.
+        Calculates a CRC16 checksum and XORs it with a type-specific key to
+        prevent data reuse between different save fields.
         
         Args:
             data: Raw bytes to compute checksum for
             key: 2-byte XOR key
+            version: Save format version whose checksum algorithm to use
             
         Returns:
             16-bit checksum value XORed with provided key
         """
-        crc = zlib.crc32(data) & 0xFFFF  # Get lower 16 bits for CRC16
+        if version == 1:
+            crc = zlib.crc32(data) & 0xFFFF  # Legacy: lower 16 bits of CRC32
+        else:
+            crc = _crc16(data)
         return crc ^ key
     
     @staticmethod
-    def _bitfield_to_base64(window_data: List[bool], key: int) -> str:
-        """Convert boolean data to a base64 string with integrity protection.
+    def _bitfield_to_base64(bits: int, length: int, key: int) -> str:
+        """Convert packed boolean data to a base64 string with integrity protection.
         
-        Packs boolean values into a bitfield, adds length and checksum data,
-        and encodes the result in base64. The resulting string includes integrity
-        checks to detect tampering.
+        Pads an already packed bitfield to a byte boundary, adds length and
+        checksum data, and encodes the result in base64. The resulting string
+        includes integrity checks to detect tampering.
         
         Binary format:
             [2 bytes] XORed CRC16 checksum
@@ -82,36 +142,35 @@ class GameState:
             [n bytes] Bitfield data (padded to byte boundary)
         
         Args:
-            window_data: List of boolean values to encode
+            bits: Packed boolean values, first entry in the most significant bit
+            length: Number of boolean values packed into bits
             key: 2-byte XOR key for checksum calculation
             
         Returns:
             Base64 encoded string containing the packed data and checksums
         """
-        if not window_data:
+        if not length:
             return ""
         
-        # Convert to bits and pad to byte boundary
-        bits = ''.join('1' if x else '0' for x in window_data)
-        length = len(window_data)
-        padded_bits = bits.ljust(((len(bits) + 7) // 8) * 8, '0')
+        # Pad to byte boundary
+        byte_count = (length + 7) // 8
+        padded_bits = bits << (byte_count * 8 - length)
         
-        # Create component bytes
-        length_bytes = length.to_bytes(2, 'big')  # 16-bit length
-        separator = b'\0'
-        bitfield_bytes = int(padded_bits, 2).to_bytes((len(padded_bits) + 7) // 8, 'big')
+        # Lay out all components in one buffer, checksum left empty for now
+        all_bytes = bytearray(_HEADER.size + byte_count)
+        _HEADER.pack_into(all_bytes, 0, 0, length, 0)
+        all_bytes[_HEADER.size:] = padded_bits.to_bytes(byte_count, 'big')
         
-        # Compute checksum over data components
-        data_for_checksum = length_bytes + separator + bitfield_bytes
-        checksum = GameState._compute_checksum(data_for_checksum, key)
-        checksum_bytes = checksum.to_bytes(2, 'big')
+        # Compute checksum over data components and fill in the header
+        checksum = GameState._compute_checksum(memoryview(all_bytes)[2:], key)
+        _HEADER.pack_into(all_bytes, 0, checksum, length, 0)
         
-        # Combine all components and encode
-        all_bytes = checksum_bytes + data_for_checksum
-        return base64.b64encode(all_bytes).decode()
+        # binascii is the C codec behind the base64 module; calling it directly
+        # skips the wrapper's argument handling
+        return binascii.b2a_base64(all_bytes, newline=False).decode('ascii')
     
     @staticmethod
-    def _base64_to_bitfield(encoded_data: str, key: int, maxlen: int) -> Deque[bool]:
+    def _base64_to_bitfield(encoded_data: str, key: int, version: int = FORMAT_VERSION) -> Tuple[int, int]:
         """Restore boolean data from a base64 string with integrity validation.
         
         Decodes and unpacks a base64 string created by _bitfield_to_base64,
@@ -120,69 +179,99 @@ class GameState:
         Args:
             encoded_data: Base64 encoded string to decode
             key: 2-byte XOR key for checksum validation
-            maxlen: Maximum length for the resulting deque
+            version: Save format version the data was written with
             
         Returns:
-            Deque containing the restored boolean values
+            Tuple of the packed boolean values (first entry in the most
+            significant bit) and the number of values
             
         Raises:
             ValueError: If checksum validation fails indicating data tampering
         """
         if not encoded_data:
-            return deque(maxlen=maxlen)
+            return 0, 0
         
         # Decode base64
-        all_bytes = base64.b64decode(encoded_data)
+        all_bytes = binascii.a2b_base64(encoded_data)
+        
+        if len(all_bytes) < _HEADER.size:
+            raise ValueError("State data integrity check failed. Save data is corrupted.")
         
         # Extract components
-        checksum_bytes = all_bytes[:2]
-        length_bytes = all_bytes[2:4]
-        separator = all_bytes[4:5]
-        bitfield_bytes = all_bytes[5:]
+        actual_checksum, length, _separator = _HEADER.unpack_from(all_bytes)
+        bitfield_bytes = all_bytes[_HEADER.size:]
         
         # Validate checksum
-        data_for_checksum = length_bytes + separator + bitfield_bytes
-        expected_checksum = GameState._compute_checksum(data_for_checksum, key)
-        actual_checksum = int.from_bytes(checksum_bytes, 'big')
+        expected_checksum = GameState._compute_checksum(memoryview(all_bytes)[2:], key, version)
         
         if expected_checksum != actual_checksum:
             raise ValueError("State data integrity check failed. Save data is corrupted.")
         
-        # Convert to bits and validate
-        length = int.from_bytes(length_bytes, 'big')
-        all_bits = bin(int.from_bytes(bitfield_bytes, 'big'))[2:].zfill(len(bitfield_bytes) * 8)
-        valid_bits = all_bits[:length]
+        # Shift out the byte padding so the last entry is the lowest bit
+        padding = len(bitfield_bytes) * 8 - length
+        if padding < 0:
+            raise ValueError("State data integrity check failed. Save data is corrupted.")
+        
+        return int.from_bytes(bitfield_bytes, 'big') >> padding, length
+    
+    def snapshot(self) -> StateSnapshot:
+        """Capture the current state as immutable primitives.
         
-        # Create and return window entries
-        return deque(
-            [bit == '1' for bit in valid_bits],
-            maxlen=maxlen
+        This only copies a few integers, so it is cheap enough to call on every
+        answer. The expensive checksum and encoding work is deferred to
+        snapshot_to_dict, which may run on another thread.
+        
+        Returns:
+            Snapshot of the current game state
+        """
+        return StateSnapshot(
+            timestamp=datetime.now(),
+            difficulty=self.current_difficulty,
+            accuracy_bits=self.accuracy_window.bits,
+            accuracy_length=len(self.accuracy_window),
+            streak_length=self.streak_count
         )
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert current state to a dictionary for storage.
+    @classmethod
+    def snapshot_to_dict(cls, snapshot: StateSnapshot) -> Dict[str, Any]:
+        """Convert a state snapshot to a dictionary for storage.
         
-        Creates a serializable dictionary containing the current game state,
+        Creates a serializable dictionary containing the captured game state,
         with boolean data compressed and integrity-protected.
         
+        Args:
+            snapshot: Snapshot created by GameState.snapshot
+            
         Returns:
             Dictionary containing version, timestamp, difficulty level, and
             integrity-protected window data
         """
         return {
-            "version": self.FORMAT_VERSION,
-            "timestamp": datetime.now().isoformat(),
-            "difficulty": self.current_difficulty,
-            "accuracy_window": self._bitfield_to_base64(
-                list(self.accuracy_window),
+            "version": cls.FORMAT_VERSION,
+            "timestamp": snapshot.timestamp.isoformat(),
+            "difficulty": snapshot.difficulty,
+            "accuracy_window": cls._bitfield_to_base64(
+                snapshot.accuracy_bits,
+                snapshot.accuracy_length,
                 SAVE_INTEGRITY_KEYS["accuracy"]
             ),
-            "streak_window": self._bitfield_to_base64(
-                self.streak_window,
+            # Streak entries are always True, so the packed field is all ones
+            "streak_window": cls._bitfield_to_base64(
+                (1 << snapshot.streak_length) - 1,
+                snapshot.streak_length,
                 SAVE_INTEGRITY_KEYS["streak"]
             )
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert current state to a dictionary for storage.
+        
+        Returns:
+            Dictionary containing version, timestamp, difficulty level, and
+            integrity-protected window data
+        """
+        return self.snapshot_to_dict(self.snapshot())
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any], window_sizes: Dict[int, int]) -> 'GameState':
         """Create a GameState instance from stored dictionary data.
@@ -198,29 +287,37 @@ class GameState:
             ValueError: If save format version is incompatible or data integrity
                         checks fail
         """
-        if data.get("version", 1) != cls.FORMAT_VERSION:
+        version = data.get("version", 1)
+        if not cls.MIN_FORMAT_VERSION <= version <= cls.FORMAT_VERSION:
             raise ValueError(f"Incompatible save format version: {data.get('version')}")
         
         state = cls()
         state.current_difficulty = data["difficulty"]
         
         # For max level, use the window size of the previous level
-        if state.current_difficulty == max(LEVEL_REQUIREMENTS.keys()):
+        if state.current_difficulty == MAX_LEVEL:
             window_size = window_sizes[state.current_difficulty - 1]
         else:
             window_size = window_sizes[state.current_difficulty]
             
         # Restore windows with integrity checks
-        state.accuracy_window = cls._base64_to_bitfield(
+        accuracy_bits, accuracy_length = cls._base64_to_bitfield(
             data["accuracy_window"],
             SAVE_INTEGRITY_KEYS["accuracy"],
-            window_size
+            version
+        )
+        state.accuracy_window = AccuracyWindow.from_bits(
+            accuracy_bits,
+            accuracy_length,
+            maxlen=window_size
         )
         
-        state.streak_window = list(cls._base64_to_bitfield(
+        # The streak is stored as a run of ones; only its length matters
+        _streak_bits, streak_length = cls._base64_to_bitfield(
             data["streak_window"],
             SAVE_INTEGRITY_KEYS["streak"],
-            window_size
-        ))
+            version
+        )
+        state.streak_count = min(streak_length, window_size)
         
         return state
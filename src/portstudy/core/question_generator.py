@@ -5,14 +5,18 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import random
-from typing import Dict, List, Tuple, Any
+from typing import Any, Callable, Dict, List, Tuple
 
 from ..config.settings import (
+    MAX_LEVEL,
     QUESTION_CHOICES,
     QUESTION_TYPE_WEIGHTS,
     PORT_DIFFICULTY_WEIGHTS
 )
 
+# (question type, question text formatter, answer field)
+QuestionTemplate = Tuple[str, Callable[[str, Dict[str, Any]], str], str]
+
 class QuestionGenerator:
     """Generates questions based on port information and difficulty levels."""
     
@@ -24,10 +28,41 @@ class QuestionGenerator:
             port_info: Dictionary containing port information
         """
         self.port_info = port_info
+        # Probability of a standard question when port entry questions are enabled
+        self._standard_threshold = QUESTION_TYPE_WEIGHTS["standard"] / (
+            QUESTION_TYPE_WEIGHTS["standard"] + QUESTION_TYPE_WEIGHTS["port_entry"]
+        )
+        # Cached (ports, cumulative weights) per difficulty level
+        self._weighted_pools: Dict[int, Tuple[Tuple[str, ...], List[int]]] = {}
         self._categorize_ports()
+        
+        # Question text is produced by f-string formatters taking (port, port info)
+        # Level 1: Basic port/protocol pairs
+        basic: Tuple[QuestionTemplate, ...] = (
+            ("port_to_protocol", lambda port, info: f"What protocol uses port {port}?", "protocol"),
+            ("protocol_to_port", lambda port, info: f"What port number does {info['protocol']} use?", "port")
+        )
+        # Level 2: Add transport protocols
+        transport: Tuple[QuestionTemplate, ...] = (
+            ("protocol_to_transport", lambda port, info: f"What transport protocol does {info['protocol']} use?", "transport"),
+        )
+        # Level 3+: More complex questions
+        detailed: Tuple[QuestionTemplate, ...] = (
+            ("port_usage", lambda port, info: f"What is the primary usage of port {port}?", "common_usage"),
+            ("protocol_description", lambda port, info: f"Which best describes {info['protocol']}?", "description")
+        )
+        
+        self._templates_by_level: Dict[int, Tuple[QuestionTemplate, ...]] = {}
+        for level in range(1, MAX_LEVEL + 1):
+            templates = basic
+            if level >= 2:
+                templates += transport
+            if level >= 3:
+                templates += detailed
+            self._templates_by_level[level] = templates
     
     def _categorize_ports(self) -> None:
-        """Categorize ports by difficulty level."""
+        """Categorize ports by difficulty level and precompute per-level port pools."""
         self.ports_by_difficulty = {
             "beginner": [],
             "intermediate": [],
@@ -37,8 +72,46 @@ class QuestionGenerator:
         for port, info in self.port_info.items():
             difficulty = info.get("difficulty", "intermediate")
             self.ports_by_difficulty[difficulty].append(port)
+        
+        beginner = tuple(self.ports_by_difficulty["beginner"])
+        intermediate = tuple(self.ports_by_difficulty["intermediate"])
+        advanced = tuple(self.ports_by_difficulty["advanced"])
+        
+        self._available_by_level: Dict[int, Tuple[str, ...]] = {}
+        for level in range(1, MAX_LEVEL + 1):
+            # Level 1-2: Only beginner ports
+            available_ports = beginner
+            
+            # Level 3-4: Add intermediate ports
+            if level >= 3:
+                available_ports += intermediate
+                
+            # Level 5: Add advanced ports
+            if level >= 5:
+                available_ports += advanced
+            
+            self._available_by_level[level] = available_ports
+        
+        # Port number distractors, converted to int once up front
+        self._port_numbers_by_level: Dict[int, Tuple[int, ...]] = {
+            level: tuple(int(p) for p in ports)
+            for level, ports in self._available_by_level.items()
+        }
+        self._similar_ports: Dict[str, Tuple[int, ...]] = {
+            port: tuple(info["similar_ports"])
+            for port, info in self.port_info.items()
+            if "similar_ports" in info
+        }
+        
+        # Distinct answer pools for multiple choice distractors
+        infos = self.port_info.values()
+        self._protocols = tuple(dict.fromkeys(info["protocol"] for info in infos))
+        self._usages = tuple(dict.fromkeys(info["common_usage"] for info in infos))
+        self._descriptions = tuple(
+            d for d in dict.fromkeys(info.get("description", "") for info in infos) if d
+        )
     
-    def _get_available_ports(self, difficulty_level: int) -> List[str]:
+    def _get_available_ports(self, difficulty_level: int) -> Tuple[str, ...]:
         """
         Get available ports based on current difficulty level.
         
@@ -46,24 +119,9 @@ class QuestionGenerator:
             difficulty_level: Current difficulty level
             
         Returns:
-            List of port numbers available at this level
+            Tuple of port numbers available at this level
         """
-        available_ports = []
-        
-        # Level 1-2: Only beginner ports
-        if difficulty_level <= 2:
-            available_ports.extend(self.ports_by_difficulty["beginner"])
-            
-        # Level 3-4: Add intermediate ports
-        if difficulty_level >= 3:
-            available_ports.extend(self.ports_by_difficulty["beginner"])
-            available_ports.extend(self.ports_by_difficulty["intermediate"])
-            
-        # Level 5: Add advanced ports
-        if difficulty_level >= 5:
-            available_ports.extend(self.ports_by_difficulty["advanced"])
-        
-        return available_ports
+        return self._available_by_level[min(difficulty_level, MAX_LEVEL)]
     
     def _select_port(self, difficulty_level: int) -> str:
         """
@@ -75,22 +133,30 @@ class QuestionGenerator:
         Returns:
             Selected port number as string
         """
-        available_ports = self._get_available_ports(difficulty_level)
-        
-        # Create weighted list based on port difficulties
-        weighted_ports = []
-        for port in available_ports:
-            difficulty = self.port_info[port]["difficulty"]
-            weight = PORT_DIFFICULTY_WEIGHTS[difficulty]
-            weighted_ports.extend([port] * weight)
+        pool = self._weighted_pools.get(difficulty_level)
+        if pool is None:
+            available_ports = self._get_available_ports(difficulty_level)
+            
+            # Build cumulative weights based on port difficulties
+            cum_weights = []
+            total = 0
+            for port in available_ports:
+                difficulty = self.port_info[port]["difficulty"]
+                total += PORT_DIFFICULTY_WEIGHTS[difficulty]
+                cum_weights.append(total)
+            
+            pool = (available_ports, cum_weights)
+            self._weighted_pools[difficulty_level] = pool
         
-        return random.choice(weighted_ports)
+        available_ports, cum_weights = pool
+        return random.choices(available_ports, cum_weights=cum_weights)[0]
     
-    def generate_port_entry_question(self, port_info: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_port_entry_question(self, port: str, port_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate a direct port entry question.
         
         Args:
+            port: Port number as string
             port_info: Dictionary containing port information
             
         Returns:
@@ -98,33 +164,50 @@ class QuestionGenerator:
         """
         return {
             "question": f"What port number does {port_info['protocol']} use?",
-            "correct_answer": port_info["port"],
+            "correct_answer": port,
             "type": "port_entry",
             "port_entry": True,
-            "port": port_info["port"],
+            "port": port,
             "port_data": port_info
         }
     
+    @staticmethod
+    def _sample_distractors(pool: Tuple[Any, ...], correct_answer: Any, count: int) -> List[Any]:
+        """
+        Sample distinct wrong answers from a pool that may contain the correct answer.
+        
+        One extra candidate is drawn so the correct answer can be discarded
+        afterwards, which avoids building a filtered copy of the pool per call.
+        
+        Args:
+            pool: Distinct candidate answers
+            correct_answer: Answer to exclude from the result
+            count: Maximum number of distractors to return
+            
+        Returns:
+            List of up to count distractors in random order
+        """
+        picks = random.sample(pool, min(len(pool), count + 1))
+        if correct_answer in picks:
+            picks.remove(correct_answer)
+        return picks[:count]
+    
     def generate_choices(self, correct_answer: Any, question_type: str, difficulty: int) -> List[Any]:
         """Generate multiple choice options for a question."""
         choices: List[Any] = []
         
         if question_type == "port":
             correct_port = str(correct_answer)
-            if difficulty >= 3 and 'similar_ports' in self.port_info[correct_port]:
-                similar_ports = self.port_info[correct_port]['similar_ports']
+            similar_ports = self._similar_ports.get(correct_port)
+            if difficulty >= 3 and similar_ports is not None:
                 choices = random.sample(similar_ports, 
                                      min(len(similar_ports), QUESTION_CHOICES - 1))
             else:
-                available_ports = self._get_available_ports(difficulty)
-                choices = random.sample([p for p in available_ports if p != correct_port], 
-                                     QUESTION_CHOICES - 1)
-                choices = [int(p) for p in choices]
+                port_numbers = self._port_numbers_by_level[min(difficulty, MAX_LEVEL)]
+                choices = self._sample_distractors(port_numbers, int(correct_port), QUESTION_CHOICES - 1)
         
         elif question_type == "protocol":
-            all_protocols = [info["protocol"] for info in self.port_info.values()]
-            choices = random.sample([p for p in all_protocols if p != correct_answer], 
-                                 QUESTION_CHOICES - 1)
+            choices = self._sample_distractors(self._protocols, correct_answer, QUESTION_CHOICES - 1)
         
         elif question_type == "transport":
             choices = ["TCP", "UDP", "TCP/UDP"]
@@ -132,14 +215,10 @@ class QuestionGenerator:
                 choices.remove(correct_answer)
                 
         elif question_type == "common_usage":
-            all_usages = list(set(info["common_usage"] for info in self.port_info.values()))
-            choices = random.sample([u for u in all_usages if u != correct_answer],
-                                 QUESTION_CHOICES - 1)
+            choices = self._sample_distractors(self._usages, correct_answer, QUESTION_CHOICES - 1)
                                  
         elif question_type == "description":
-            all_descriptions = list(set(info.get("description", "") for info in self.port_info.values()))
-            all_descriptions = [d for d in all_descriptions if d and d != correct_answer]
-            choices = random.sample(all_descriptions, min(len(all_descriptions), QUESTION_CHOICES - 1))
+            choices = self._sample_distractors(self._descriptions, correct_answer, QUESTION_CHOICES - 1)
         
         choices.append(correct_answer)
         random.shuffle(choices)
@@ -153,55 +232,32 @@ class QuestionGenerator:
             difficulty: Current difficulty level
             
         Returns:
-            Dictionary containing question data
+            Dictionary containing question data. The port_data entry is the
+            shared port information dictionary and must not be modified.
         """
         # Select question type based on weights and level
         if difficulty >= 4:
-            question_type = random.choices(
-                ["standard", "port_entry"],
-                weights=[QUESTION_TYPE_WEIGHTS["standard"], QUESTION_TYPE_WEIGHTS["port_entry"]]
-            )[0]
+            question_type = "standard" if random.random() < self._standard_threshold else "port_entry"
         else:
             question_type = "standard"
         
         # Select a port and get its data
         port = self._select_port(difficulty)
-        port_data = self.port_info[port].copy()
-        port_data['port'] = port
+        port_data = self.port_info[port]
         
         # Generate port entry question if selected
         if question_type == "port_entry":
-            return self.generate_port_entry_question(port_data)
+            return self.generate_port_entry_question(port, port_data)
         
         # Generate standard multiple choice question
-        question_types: List[Tuple[str, str, str]] = []
-        
-        # Level 1: Basic port/protocol pairs
-        if difficulty >= 1:
-            question_types.extend([
-                ("port_to_protocol", "What protocol uses port {port}?", "protocol"),
-                ("protocol_to_port", "What port number does {protocol} use?", "port")
-            ])
-        
-        # Level 2: Add transport protocols
-        if difficulty >= 2:
-            question_types.append(
-                ("protocol_to_transport", "What transport protocol does {protocol} use?", "transport")
-            )
-        
-        # Level 3+: More complex questions
-        if difficulty >= 3:
-            question_types.extend([
-                ("port_usage", "What is the primary usage of port {port}?", "common_usage"),
-                ("protocol_description", "Which best describes {protocol}?", "description")
-            ])
-        
-        question_type, template, answer_type = random.choice(question_types)
+        templates = self._templates_by_level[min(difficulty, MAX_LEVEL)]
+        question_type, format_question, answer_type = random.choice(templates)
+        correct_answer = port if answer_type == "port" else port_data[answer_type]
         
         return {
-            "question": template.format(**port_data),
-            "correct_answer": port_data[answer_type],
-            "choices": self.generate_choices(port_data[answer_type], answer_type, difficulty),
+            "question": format_question(port, port_data),
+            "correct_answer": correct_answer,
+            "choices": self.generate_choices(correct_answer, answer_type, difficulty),
             "type": answer_type,
             "port_entry": False,
             "port": port,
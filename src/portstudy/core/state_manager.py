@@ -4,26 +4,110 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import atexit
 import json
+import os
 import sys
+import threading
 import traceback
-import base64
-from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 from datetime import datetime
 from colorama import Fore, Style
 
-from ..utils.paths import get_save_file_path, get_backup_save_file_path
-from .game_state import GameState
+from ..config.settings import AUTOSAVE_INTERVAL, SAVE_FLUSH_TIMEOUT
+from ..utils.paths import SAVE_FILE_STR, BACKUP_SAVE_FILE_STR
+from .game_state import GameState, StateSnapshot
 from ..__init__ import __version__
 
+class _SaveWorker(threading.Thread):
+    """Background thread that serializes and writes game state snapshots.
+    
+    Holds a single pending snapshot. Submitting while a write is in progress
+    replaces any snapshot that has not been picked up yet, so only the most
+    recent state is ever written.
+    """
+    
+    def __init__(self, write: Callable[[StateSnapshot], bool]) -> None:
+        """
+        Initialize the worker thread.
+        
+        Args:
+            write: Callback that serializes and writes a snapshot
+        """
+        super().__init__(name="portstudy-save", daemon=True)
+        self._write = write
+        self._lock = threading.Lock()
+        self._pending: Optional[StateSnapshot] = None
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+    
+    def submit(self, snapshot: StateSnapshot) -> None:
+        """
+        Queue a snapshot for writing, replacing any unwritten one.
+        
+        Args:
+            snapshot: Snapshot of the game state to save
+        """
+        with self._lock:
+            self._pending = snapshot
+            self._idle.clear()
+        self._wakeup.set()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every submitted snapshot has been written.
+        
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            bool: True if the worker is idle, False if the timeout expired
+        """
+        return self._idle.wait(timeout)
+    
+    def run(self) -> None:
+        """Write pending snapshots as they are submitted."""
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                self._wakeup.clear()
+                snapshot = self._pending
+                self._pending = None
+            
+            # Always mark the worker idle again, even if a write raised, so
+            # flush() cannot wait on a write that will never finish
+            try:
+                if snapshot is not None:
+                    self._write(snapshot)
+            finally:
+                with self._lock:
+                    if self._pending is None:
+                        self._idle.set()
+
 class StateManager:
     """Handles saving and loading of game states with backup functionality."""
     
     def __init__(self) -> None:
         """Initialize the state manager with appropriate file paths."""
-        self.state_file = get_save_file_path()
-        self.backup_file = get_backup_save_file_path()
+        # File I/O goes through plain strings to skip pathlib conversions
+        self._state_file_str = SAVE_FILE_STR
+        self._backup_file_str = BACKUP_SAVE_FILE_STR
+        
+        # Changes not yet handed to the save worker, and whether this session
+        # has already moved the previous save to the backup file
+        self._unsaved_changes = 0
+        self._backup_rotated = False
+        
+        # Failure from the save worker, reported on the main thread so the
+        # message never lands in the middle of a prompt
+        self.last_error: Optional[Exception] = None
+        
+        # Saves are written off the UI thread; the atexit hook is a safety net
+        # for exits that bypass an explicit flush()
+        self._worker = _SaveWorker(self._write_snapshot)
+        self._worker.start()
+        atexit.register(self.flush)
     
     def _generate_bug_report(self, error: Exception, traceback_str: str, save_data: Optional[str] = None) -> str:
         """
@@ -50,47 +134,115 @@ class StateManager:
         ]
         
         if save_data:
-            try:
-                encoded_save = base64.b64encode(save_data.encode()).decode()
-                report.extend([
-                    "",
-                    "CURRENT STATE:",
-                    encoded_save
-                ])
-            except Exception as e:
-                report.extend([
-                    "",
-                    "Failed to encode save data:",
-                    str(e)
-                ])
+            # Save files are plain JSON text, so include them as-is
+            report.extend([
+                "",
+                "CURRENT STATE:",
+                "```",
+                save_data,
+                "```"
+            ])
         
         report.append("##################################")
         return "\n".join(report)
     
-    def save_state(self, game_state: GameState) -> bool:
+    def save_state(self, game_state: GameState, force: bool = False) -> bool:
         """
-        Save current state with backup.
+        Queue the current state to be saved with backup.
+        
+        Unless forced, the state is only written once every AUTOSAVE_INTERVAL
+        calls; the calls in between just mark the state as changed. Only a
+        snapshot of the state is taken here; serialization and file I/O happen
+        on the background save worker.
         
         Args:
             game_state: The current game state to save
+            force: Write the state now regardless of the autosave interval
             
         Returns:
-            bool: True if save was successful, False otherwise
+            bool: True if the save was queued, False if it was deferred
         """
-        state_data = game_state.to_dict()
+        self._report_save_error()
         
+        self._unsaved_changes += 1
+        if not force and self._unsaved_changes < AUTOSAVE_INTERVAL:
+            return False
+        
+        self._unsaved_changes = 0
+        self._worker.submit(game_state.snapshot())
+        return True
+    
+    def flush(self) -> bool:
+        """
+        Wait for every queued save to be written to disk.
+        
+        Waits at most SAVE_FLUSH_TIMEOUT seconds, and not at all if the save
+        worker is no longer running, so exiting can never hang on a save.
+        The user is warned if the saves could not be confirmed.
+        
+        Returns:
+            bool: True if every queued save was written successfully
+        """
+        timeout = SAVE_FLUSH_TIMEOUT if self._worker.is_alive() else 0
+        if not self._worker.flush(timeout):
+            print(f"{Fore.YELLOW}Could not confirm that your progress was saved.{Style.RESET_ALL}")
+            return False
+        return self._report_save_error()
+    
+    def _report_save_error(self) -> bool:
+        """
+        Print and clear any failure recorded by the save worker.
+        
+        Returns:
+            bool: True if no save failure was pending, False otherwise
+        """
+        error, self.last_error = self.last_error, None
+        if error is None:
+            return True
+        print(f"{Fore.RED}Error saving state: {error}{Style.RESET_ALL}")
+        return False
+    
+    def _write_snapshot(self, snapshot: StateSnapshot) -> bool:
+        """
+        Serialize a state snapshot and write it to disk with backup.
+        
+        Runs on the save worker thread, so failures are recorded in
+        last_error instead of being printed.
+        
+        Args:
+            snapshot: Snapshot of the game state to save
+            
+        Returns:
+            bool: True if save was successful, False otherwise
+        """
         try:
-            # If current state file exists, move it to backup
-            if self.state_file.exists():
-                self.state_file.replace(self.backup_file)
+            state_data = GameState.snapshot_to_dict(snapshot)
+            
+            # Encode in one shot (C encoder) before touching any files;
+            # json.dump streams through the pure-Python encoder instead.
+            # Compact separators drop the whitespace after every key and value
+            payload = json.dumps(state_data, separators=(',', ':')).encode('ascii')
+            
+            # Write the new state next to the save file first, so an
+            # interrupted write can never leave a torn primary save
+            temp_file = self._state_file_str + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Move the previous session's save to backup on the first write
+            if not self._backup_rotated:
+                if os.path.exists(self._state_file_str):
+                    os.replace(self._state_file_str, self._backup_file_str)
+                self._backup_rotated = True
             
-            # Write new state
-            with self.state_file.open('w') as f:
-                json.dump(state_data, f)
+            # Atomically swap the complete new state into place
+            os.replace(temp_file, self._state_file_str)
             return True
             
         except Exception as e:
-            print(f"{Fore.RED}Error saving state: {e}{Style.RESET_ALL}")
+            self.last_error = e
             return False
     
     def load_state(self, window_sizes: Dict[int, int]) -> GameState:
@@ -111,20 +263,20 @@ class StateManager:
         last_traceback = None
         
         # Try primary save first
-        state, error, tb = self._try_load_file(self.state_file, window_sizes)
+        state, error, tb = self._try_load_file(self._state_file_str, window_sizes)
         if error:
             last_error = error
             last_traceback = tb
             save_content = None
             try:
-                with self.state_file.open('r') as f:
+                with open(self._state_file_str, 'r') as f:
                     save_content = f.read()
             except:
                 pass
             
             print(f"{Fore.YELLOW}Primary save failed, attempting backup...{Style.RESET_ALL}")
             # Try backup
-            state, backup_error, backup_tb = self._try_load_file(self.backup_file, window_sizes)
+            state, backup_error, backup_tb = self._try_load_file(self._backup_file_str, window_sizes)
             if backup_error:
                 last_error = backup_error
                 last_traceback = backup_tb
@@ -154,7 +306,7 @@ class StateManager:
             else:
                 print(f"{Fore.RED}Please enter 'y' or 'n'{Style.RESET_ALL}")
     
-    def _try_load_file(self, file_path: Path, window_sizes: Dict[int, int]) -> Tuple[Optional[GameState], Optional[Exception], Optional[str]]:
+    def _try_load_file(self, file_path: str, window_sizes: Dict[int, int]) -> Tuple[Optional[GameState], Optional[Exception], Optional[str]]:
         """
         Attempt to load state from a specific file.
         
@@ -164,13 +316,12 @@ class StateManager:
             - Exception if one occurred, None if successful
             - Traceback string if exception occurred, None if successful
         """
-        if not file_path.exists():
-            return None, None, None
-            
         try:
-            with file_path.open('r') as f:
-                save_content = f.read()
-                data = json.loads(save_content)
-                return GameState.from_dict(data, window_sizes), None, None
+            # Parse the raw bytes directly; a missing file is not an error
+            with open(file_path, 'rb') as f:
+                data = json.loads(f.read())
+            return GameState.from_dict(data, window_sizes), None, None
+        except FileNotFoundError:
+            return None, None, None
         except Exception as e:
             return None, e, traceback.format_exc()
@@ -5,13 +5,12 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import sys
-import subprocess
-import platform
 import os
-import ctypes
 
 def hide_console():
     """Hide the console window on Windows."""
+    import ctypes
+    
     kernel32 = ctypes.WinDLL('kernel32')
     user32 = ctypes.WinDLL('user32')
     get_window = kernel32.GetConsoleWindow
@@ -26,8 +25,11 @@ def main():
     # through the module system, which breaks imports. We need to re-launch in the correct
     # environment to ensure proper module resolution. Additionally, Windows Terminal
     # provides better Unicode support than the cmd.exe shell PyInstaller uses by default.
-    if platform.system().lower() == "windows":
+    if sys.platform == "win32":
         if not os.environ.get("WT_SESSION"):
+            # Only needed to relaunch, so keep them off the normal startup path
+            import subprocess
+            
             try:
                 # Hide the console window
                 hide_console()
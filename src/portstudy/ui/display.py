@@ -5,18 +5,53 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import os
+import sys
 from typing import Dict, Any, List, Optional
 from colorama import Fore, Style, init
 
-from ..config.settings import ACCURACY_COLOR_THRESHOLDS, ASCII_ART
+from ..config.settings import ACCURACY_COLOR_LUT, ASCII_ART, LEVEL_REQUIREMENTS, MAX_LEVEL
+from ..core.accuracy_window import AccuracyWindow
 from ..core.game_state import GameState
 
 # Initialize colorama
 init(autoreset=True)
 
+# Clear the screen with an ANSI escape instead of spawning a shell; colorama
+# translates it for legacy Windows consoles. Terminals that opt out of escape
+# codes keep using the system clear command.
+_ANSI_CLEAR = os.environ.get('TERM') != 'dumb' and 'NO_COLOR' not in os.environ
+_CLEAR_SEQUENCE = '\x1b[2J\x1b[H'
+
+# Line terminator for batched output; the reset mirrors what colorama's
+# autoreset appends after each print() call
+_LINE_END = Style.RESET_ALL + '\n'
+
+# Fore escape for every whole accuracy percentage, resolved once at import
+_ACCURACY_COLORS = tuple(getattr(Fore, name) for name in ACCURACY_COLOR_LUT)
+
+# Colored segments for the recent results bar, keyed by block state
+_BLOCK_MAP = {
+    None: Fore.WHITE + '·',  # Placeholder for no data
+    True: Fore.GREEN + '█',  # Correct answers
+    False: Fore.RED + '█'    # Incorrect answers
+}
+
 def clear_screen() -> None:
     """Clear the terminal screen in a cross-platform way."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _ANSI_CLEAR:
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+def write_lines(lines: List[str]) -> None:
+    """
+    Write several lines to the terminal in a single call.
+    
+    Args:
+        lines: Lines to write, without trailing newlines
+    """
+    sys.stdout.write(_LINE_END.join(lines) + _LINE_END)
 
 def get_accuracy_color(accuracy: float) -> str:
     """
@@ -28,44 +63,80 @@ def get_accuracy_color(accuracy: float) -> str:
     Returns:
         Colorama color code for the accuracy level
     """
-    for threshold, color in ACCURACY_COLOR_THRESHOLDS:
-        if accuracy >= threshold:
-            return getattr(Fore, color)
-    return Fore.RED
+    return _ACCURACY_COLORS[min(max(int(accuracy), 0), 100)]
+
+def _reduce_blocks(
+    bits: int,
+    length: int,
+    display_width: int,
+    block_size: int
+) -> List[Optional[bool]]:
+    """
+    Reduce packed accuracy results to one state per block of the results bar.
+    
+    Blocks are filled right-to-left from the newest result, so when the
+    window does not divide evenly the leftover oldest results share the
+    leftmost block.
+    
+    Args:
+        bits: Packed results as stored by AccuracyWindow, newest in the lowest bit
+        length: Number of results packed into bits
+        display_width: Number of blocks in the bar
+        block_size: Number of results per block
+        
+    Returns:
+        List of display_width block states: None for no data, False if the
+        block holds an incorrect result, True if every result is correct
+    """
+    blocks: List[Optional[bool]] = [None] * display_width
+    
+    # Work on the packed results directly: the newest result is the lowest
+    # bit, so each block is the low block_size bits before shifting them out
+    remaining = length
+    mask = (1 << block_size) - 1
+    
+    # Fill blocks right-to-left, newest results first
+    for i in range(display_width - 1, -1, -1):
+        if remaining <= 0:
+            break  # No more data to process
+        if remaining < block_size:
+            mask = (1 << remaining) - 1  # Partial block of the oldest results
+        
+        # All bits set in the block means every answer in it was correct
+        blocks[i] = bits & mask == mask
+        bits >>= block_size
+        remaining -= block_size
+    
+    return blocks
 
 def display_level_progress(
     current_difficulty: int,
-    accuracy_window: List[bool],
-    streak_window: List[bool],
-    level_requirements: Dict[int, Dict[str, Optional[int]]]
+    accuracy_window: AccuracyWindow,
+    streak_count: int
 ) -> None:
     """
     Display progress towards next level.
     
     Args:
         current_difficulty: Current difficulty level
-        accuracy_window: List of recent accuracy results
-        streak_window: List of streak data
-        level_requirements: Dictionary of level requirements
+        accuracy_window: Window of recent accuracy results
+        streak_count: Current streak of qualifying correct answers
     """
-    if current_difficulty == max(level_requirements.keys()):
+    if current_difficulty == MAX_LEVEL:
         print(f"\n{Fore.GREEN}Maximum level reached!{Style.RESET_ALL}")
         return
 
-    current_reqs = level_requirements[current_difficulty]
+    current_reqs = LEVEL_REQUIREMENTS[current_difficulty]
     window_size = current_reqs["window"]
     
-    if not accuracy_window:
-        current_accuracy = 0
-    else:
-        correct = sum(1 for q in accuracy_window if q)
-        current_accuracy = (correct / len(accuracy_window)) * 100
+    current_accuracy = accuracy_window.accuracy_percent
     
-    current_streak = len(streak_window)
+    current_streak = streak_count
     min_streak = current_reqs["streak"]
     accuracy_required = current_reqs["accuracy"]
     
-    print(f"\n{Fore.CYAN}Level {current_difficulty} Progress:{Style.RESET_ALL}")
+    # Collect the output and write it once at the end
+    lines = [f"\n{Fore.CYAN}Level {current_difficulty} Progress:{Style.RESET_ALL}"]
     
     # Show streak progress bar
     width = 50
@@ -78,59 +149,38 @@ def display_level_progress(
     else:
         progress_bar = Fore.RED + '░' * width
         
-    print(f"Streak Progress: |{progress_bar}{Fore.WHITE}| {current_streak}/{min_streak}")
+    lines.append(f"Streak Progress: |{progress_bar}{Fore.WHITE}| {current_streak}/{min_streak}")
     
     # Show scaled accuracy window visualization
     if window_size:
         # Fixed display width
         display_width = width  # Bar width for visualization
         block_size = max(1, len(accuracy_window) // display_width)  # Scale data to fit
-
-        # Initialize blocks list
-        blocks = [None] * display_width  # Placeholder for the entire bar
-
-        # Traverse the accuracy_window backward and fill blocks right-to-left
-        for i in range(display_width):
-            start_idx = max(0, len(accuracy_window) - (i + 1) * block_size)
-            end_idx = len(accuracy_window) - i * block_size
-            if start_idx >= end_idx:
-                break  # No more data to process
-
-            # Check this segment of the data
-            block = accuracy_window[start_idx:end_idx]
-            if any(not result for result in block):
-                blocks[display_width - 1 - i] = False  # At least one wrong in this segment
-            elif block:  # Ensure block isn't empty
-                blocks[display_width - 1 - i] = True  # All correct
+        blocks = _reduce_blocks(accuracy_window.bits, len(accuracy_window), display_width, block_size)
 
         # Build the visualization string
-        accuracy_bar = ""
-        for block in blocks:
-            if block is None:
-                accuracy_bar += Fore.WHITE + '·'  # Placeholder for no data
-            elif block:
-                accuracy_bar += Fore.GREEN + '█'  # Correct answers
-            else:
-                accuracy_bar += Fore.RED + '█'  # Incorrect answers
+        accuracy_bar = ''.join([_BLOCK_MAP[block] for block in blocks])
 
         # Show block size in the label if it's greater than 1
         window_label = f"{len(accuracy_window)}/{window_size}"
         if block_size > 1:
             window_label += f" ({block_size}/□)"
 
-        print(f"Recent Results:  |{accuracy_bar}{Fore.WHITE}| {window_label}")
+        lines.append(f"Recent Results:  |{accuracy_bar}{Fore.WHITE}| {window_label}")
     
     # Show accuracy information
     accuracy_color = get_accuracy_color(current_accuracy)
-    print(f"Current Window Accuracy: {accuracy_color}{current_accuracy:.1f}%{Style.RESET_ALL}")
-    print(f"Required Accuracy: {accuracy_required}%")
+    lines.append(f"Current Window Accuracy: {accuracy_color}{current_accuracy:.1f}%{Style.RESET_ALL}")
+    lines.append(f"Required Accuracy: {accuracy_required}%")
     
     # Show status message
     if current_accuracy < accuracy_required:
-        print(f"{Fore.RED}Accuracy below {accuracy_required}% - streak reset!{Style.RESET_ALL}")
+        lines.append(f"{Fore.RED}Accuracy below {accuracy_required}% - streak reset!{Style.RESET_ALL}")
     elif current_streak < min_streak:
         remaining = min_streak - current_streak
-        print(f"Maintain {accuracy_required}% accuracy for {remaining} more questions to advance")
+        lines.append(f"Maintain {accuracy_required}% accuracy for {remaining} more questions to advance")
+    
+    write_lines(lines)
 
 def display_statistics(session_data: Dict[str, Any], game_state: GameState) -> None:
     """
@@ -5,12 +5,12 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import time
-from collections import deque
 from typing import Dict, Any, Optional
 from datetime import datetime
 from colorama import Fore, Style
 
-from ..config.settings import MENU_OPTIONS, LEVEL_REQUIREMENTS
+from ..config.settings import MENU_OPTIONS, LEVEL_REQUIREMENTS, MAX_LEVEL
+from ..core.accuracy_window import AccuracyWindow
 from ..core.state_manager import StateManager
 from ..core.question_generator import QuestionGenerator
 from .display import (
@@ -18,7 +18,8 @@ from .display import (
     display_main_menu,
     display_statistics,
     display_level_progress,
-    display_reference_info
+    display_reference_info,
+    write_lines
 )
 
 class MenuSystem:
@@ -82,7 +83,8 @@ class MenuSystem:
                 continue
         
         print(f"\n\n{Fore.GREEN}Thanks for studying! Saving progress...{Style.RESET_ALL}")
-        self.state_manager.save_state(self.game_state)
+        self.state_manager.save_state(self.game_state, force=True)
+        self.state_manager.flush()
     
     def practice_mode(self) -> None:
         """Run the practice mode session."""
@@ -107,7 +109,7 @@ class MenuSystem:
                 
         except KeyboardInterrupt:
             print(f"\n\n{Fore.YELLOW}Study session ended. Saving progress...{Style.RESET_ALL}")
-            self.state_manager.save_state(self.game_state)
+            self.state_manager.save_state(self.game_state, force=True)
     
     def _get_user_answer(self, num_choices: Optional[int] = None) -> Optional[int]:
         """Get and validate user input for question answers."""
@@ -141,82 +143,101 @@ class MenuSystem:
         """Run a single practice question."""
         clear_screen()
         self.questions_answered += 1
+        game_state = self.game_state
+        level = game_state.current_difficulty
         
         # Generate question for current difficulty
-        question_data = self.question_gen.generate_question(self.game_state.current_difficulty)
+        question_data = self.question_gen.generate_question(level)
         
-        # Display question
-        print(f"{Fore.CYAN}=== Practice Mode ==={Style.RESET_ALL}")
-        print(f"{Fore.GREEN}Current Level: {self.game_state.current_difficulty}{Style.RESET_ALL}")
-        print(f"\n{Fore.YELLOW}Question {self.questions_answered}{Style.RESET_ALL}")
-        print(f"\n{question_data['question']}")
+        # Display question in a single write
+        lines = [
+            f"{Fore.CYAN}=== Practice Mode ==={Style.RESET_ALL}",
+            f"{Fore.GREEN}Current Level: {level}{Style.RESET_ALL}",
+            f"\n{Fore.YELLOW}Question {self.questions_answered}{Style.RESET_ALL}",
+            f"\n{question_data['question']}"
+        ]
         
-        if question_data.get('port_entry'):
+        port_entry = question_data.get('port_entry')
+        choices = question_data.get('choices')
+        if port_entry:
+            write_lines(lines)
             answer = self._get_user_answer()
         else:
-            for idx, choice in enumerate(question_data['choices'], 1):
-                print(f"{idx}. {choice}")
-            answer = self._get_user_answer(len(question_data['choices']))
+            for idx, choice in enumerate(choices, 1):
+                lines.append(f"{idx}. {choice}")
+            write_lines(lines)
+            answer = self._get_user_answer(len(choices))
         
         if answer is None:
             raise KeyboardInterrupt
         
-        if question_data.get('port_entry'):
+        if port_entry:
             user_answer = str(answer)
         else:
-            user_answer = question_data['choices'][answer - 1]
+            user_answer = choices[answer - 1]
         
         is_correct = user_answer == question_data['correct_answer']
         
         self._process_answer(is_correct, question_data)
+        
+        # Answering may have changed the level and replaced the accuracy window
+        new_level = game_state.current_difficulty
+        
+        # Queue the save before rendering so the worker writes it while the
+        # user reads the results. Level changes are saved right away; other
+        # answers are batched
+        self.state_manager.save_state(game_state, force=new_level != level)
+        
         display_reference_info(question_data['port'], question_data['port_data'])
         display_level_progress(
-            self.game_state.current_difficulty,
-            list(self.game_state.accuracy_window),
-            self.game_state.streak_window,
-            LEVEL_REQUIREMENTS
+            new_level,
+            game_state.accuracy_window,
+            game_state.streak_count
         )
-        self.state_manager.save_state(self.game_state)
     
     def check_level_progress(self, is_correct: bool) -> bool:
         """Check if user should level up based on streak and accuracy."""
-        if self.game_state.current_difficulty == max(LEVEL_REQUIREMENTS.keys()):
+        game_state = self.game_state
+        level = game_state.current_difficulty
+        if level == MAX_LEVEL:
             return False
 
         # Add new question to accuracy window
-        self.game_state.accuracy_window.append(is_correct)
+        accuracy_window = game_state.accuracy_window
+        accuracy_window.append(is_correct)
 
         # Get current level requirements
-        level_reqs = LEVEL_REQUIREMENTS[self.game_state.current_difficulty]
+        level_reqs = LEVEL_REQUIREMENTS[level]
+        accuracy_required = level_reqs["accuracy"]
         
         # Calculate current accuracy
-        if not self.game_state.accuracy_window:
+        if not accuracy_window:
             return False
             
-        correct = sum(1 for q in self.game_state.accuracy_window if q)
-        current_accuracy = (correct / len(self.game_state.accuracy_window)) * 100
+        current_accuracy = accuracy_window.accuracy_percent
         
-        # Update streak window
-        if current_accuracy >= level_reqs["accuracy"]:
+        # Update streak count
+        if current_accuracy >= accuracy_required:
             if is_correct:
-                self.game_state.streak_window.append(True)
+                game_state.streak_count += 1
         else:
-            self.game_state.streak_window = []
+            game_state.streak_count = 0
         
         # Check if requirements are met for level up
-        if (len(self.game_state.streak_window) >= level_reqs["streak"] and 
-            current_accuracy >= level_reqs["accuracy"]):
+        if (game_state.streak_count >= level_reqs["streak"] and 
+            current_accuracy >= accuracy_required):
             # Level up
-            self.game_state.current_difficulty += 1
+            level += 1
+            game_state.current_difficulty = level
             
             # Reset windows for new level
-            self.game_state.streak_window = []
-            self.game_state.accuracy_window.clear()
+            game_state.streak_count = 0
+            accuracy_window.clear()
             
             # Set new window size if not max level
-            if self.game_state.current_difficulty < max(LEVEL_REQUIREMENTS.keys()):
-                new_size = LEVEL_REQUIREMENTS[self.game_state.current_difficulty]["window"]
-                self.game_state.accuracy_window = deque(maxlen=new_size)
+            if level < MAX_LEVEL:
+                new_size = LEVEL_REQUIREMENTS[level]["window"]
+                game_state.accuracy_window = AccuracyWindow(maxlen=new_size)
             
             return True
         
@@ -233,44 +254,47 @@ class MenuSystem:
         Returns:
             bool: True if difficulty decreased, False otherwise
         """
-        if self.game_state.current_difficulty <= 1:
+        game_state = self.game_state
+        level = game_state.current_difficulty
+        if level <= 1:
             return False
             
-        if not self.game_state.accuracy_window:
+        accuracy_window = game_state.accuracy_window
+        if not accuracy_window:
             return False
         
         # Only check regression after accumulating meaningful data
-        min_samples = max(5, self.game_state.accuracy_window.maxlen // 3)
-        if len(self.game_state.accuracy_window) < min_samples:
+        min_samples = max(5, accuracy_window.maxlen // 3)
+        if len(accuracy_window) < min_samples:
             return False
             
-        correct = sum(1 for q in self.game_state.accuracy_window if q)
-        recent_accuracy = (correct / len(self.game_state.accuracy_window)) * 100
+        recent_accuracy = accuracy_window.accuracy_percent
         
-        if recent_accuracy < LEVEL_REQUIREMENTS[self.game_state.current_difficulty - 1]["accuracy"] - 10:
-            self.game_state.current_difficulty -= 1
+        if recent_accuracy < LEVEL_REQUIREMENTS[level - 1]["accuracy"] - 10:
+            level -= 1
+            game_state.current_difficulty = level
             
             # Reset windows for new level
-            self.game_state.streak_window = []
-            new_size = LEVEL_REQUIREMENTS[self.game_state.current_difficulty]["window"]
-            self.game_state.accuracy_window = deque(maxlen=new_size)
+            game_state.streak_count = 0
+            new_size = LEVEL_REQUIREMENTS[level]["window"]
+            game_state.accuracy_window = AccuracyWindow(maxlen=new_size)
             return True
             
         return False
     
     def _process_answer(self, is_correct: bool, question_data: Dict[str, Any]) -> None:
         """Process and handle a user's answer."""
+        session = self.current_session
+        session["total"] += 1
         if is_correct:
             print(f"\n{Fore.GREEN}✓ Correct!{Style.RESET_ALL}")
-            self.current_session["correct"] += 1
-            self.current_session["total"] += 1
+            session["correct"] += 1
             
             if self.check_level_progress(True):
                 print(f"\n{Fore.GREEN}🎉 Level Up! You've advanced to level {self.game_state.current_difficulty}!{Style.RESET_ALL}")
                 print("You've consistently maintained the required accuracy. Great job!")
         else:
             print(f"\n{Fore.RED}✗ Incorrect. The correct answer is {question_data['correct_answer']}{Style.RESET_ALL}")
-            self.current_session["total"] += 1
             
             self.check_level_progress(False)
             if self.check_difficulty_regression():
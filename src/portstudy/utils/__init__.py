@@ -5,6 +5,13 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from .paths import (
+    PATHS,
+    APP_DATA_DIR,
+    SAVE_FILE,
+    BACKUP_SAVE_FILE,
+    SAVE_FILE_STR,
+    BACKUP_SAVE_FILE_STR,
+    DATA_FILE,
     get_app_data_dir,
     get_save_file_path,
     get_backup_save_file_path,
@@ -13,6 +20,13 @@ from .paths import (
 )
 
 __all__ = [
+    'PATHS',
+    'APP_DATA_DIR',
+    'SAVE_FILE',
+    'BACKUP_SAVE_FILE',
+    'SAVE_FILE_STR',
+    'BACKUP_SAVE_FILE_STR',
+    'DATA_FILE',
     'get_app_data_dir',
     'get_save_file_path',
     'get_backup_save_file_path',
@@ -5,38 +5,114 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import os
-import platform
+import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
-def get_app_data_dir() -> Path:
-    """Get the appropriate application data directory for the current platform."""
-    system = platform.system().lower()
-    
-    if system == 'windows':
-        base_dir = os.environ.get('APPDATA')
-        if not base_dir:
-            base_dir = os.path.join(os.environ['USERPROFILE'], 'AppData', 'Roaming')
-        return Path(base_dir) / 'PortStudy'
+# Platform identifier, fixed when the interpreter starts
+_SYSTEM = sys.platform
+
+# User home directory, expanded once
+_HOME = os.path.expanduser('~')
+
+# Linux data root per the XDG base directory spec, read from the environment
+# once. Relative values are invalid under the spec and are ignored
+_XDG_DATA_HOME = os.environ.get('XDG_DATA_HOME', '')
+if not os.path.isabs(_XDG_DATA_HOME):
+    _XDG_DATA_HOME = os.path.join(_HOME, '.local', 'share')
+
+# Windows roaming application data root, read from the environment once
+_APPDATA: Optional[str] = None
+if _SYSTEM == 'win32':
+    # The fallback suffix is fixed and only used on Windows, so plain
+    # concatenation does the job of os.path.join. This runs at import, so it
+    # must not raise when USERPROFILE is missing too
+    _APPDATA = os.environ.get('APPDATA') or os.environ.get('USERPROFILE', _HOME) + '\\AppData\\Roaming'
+
+def _compute_app_data_dir() -> str:
+    """Compute the appropriate application data directory for the current platform."""
+    if _SYSTEM == 'win32':
+        return os.path.join(_APPDATA, 'PortStudy')
     
-    elif system == 'darwin':
-        return Path.home() / 'Library' / 'Application Support' / 'PortStudy'
+    elif _SYSTEM == 'darwin':
+        return os.path.join(_HOME, 'Library', 'Application Support', 'PortStudy')
     
     else:  # Linux and other Unix-like systems
-        return Path.home() / '.port_study'
+        # Existing installs keep the original location so their saves still load
+        legacy_dir = os.path.join(_HOME, '.port_study')
+        if os.path.isdir(legacy_dir):
+            return legacy_dir
+        return os.path.join(_XDG_DATA_HOME, 'port_study')
+
+# These cannot change while the program runs, so resolve them once at import.
+# Paths are joined as plain strings and only wrapped in Path at the end
+_APP_DATA_DIR_STR = _compute_app_data_dir()
+APP_DATA_DIR = Path(_APP_DATA_DIR_STR)
+SAVE_FILE_STR = os.path.join(_APP_DATA_DIR_STR, 'game_state.json')
+BACKUP_SAVE_FILE_STR = os.path.join(_APP_DATA_DIR_STR, 'game_state.backup.json')
+SAVE_FILE = Path(SAVE_FILE_STR)
+BACKUP_SAVE_FILE = Path(BACKUP_SAVE_FILE_STR)
+
+# Bundled data ships next to the package; resolve symlinks and relative
+# components once so the data file path is already canonical
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+DATA_FILE = Path(os.path.join(_PACKAGE_DIR, 'data', 'ports.json'))
+
+@dataclass(frozen=True)
+class _Paths:
+    """Resolved application file locations.
+    
+    Attributes:
+        app_dir (Path): Application data directory
+        save (Path): Save file
+        backup (Path): Backup save file
+        data (Path): Bundled ports data file
+    """
+    
+    # Declared by hand since dataclass(slots=True) requires Python 3.10
+    __slots__ = ("app_dir", "save", "backup", "data")
+    
+    app_dir: Path
+    save: Path
+    backup: Path
+    data: Path
+
+# Callers read PATHS.save etc. directly instead of calling a getter
+PATHS = _Paths(
+    app_dir=APP_DATA_DIR,
+    save=SAVE_FILE,
+    backup=BACKUP_SAVE_FILE,
+    data=DATA_FILE
+)
+
+# Set once the application directories have been created this run
+_DIRS_ENSURED = False
+
+def get_app_data_dir() -> Path:
+    """Get the appropriate application data directory for the current platform."""
+    return PATHS.app_dir
 
 def get_save_file_path() -> Path:
     """Get the path to the save file."""
-    return get_app_data_dir() / 'game_state.json'
+    return PATHS.save
 
 def get_backup_save_file_path() -> Path:
     """Get the path to the backup save file."""
-    return get_app_data_dir() / 'game_state.backup.json'
+    return PATHS.backup
 
 def get_data_file_path() -> Path:
     """Get the path to the ports data file."""
-    return Path(__file__).parent.parent / 'data' / 'ports.json'
+    return PATHS.data
 
 def ensure_app_dirs_exist() -> None:
-    """Ensure all necessary application directories exist."""
-    app_dir = get_app_data_dir()
-    app_dir.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+    """Ensure all necessary application directories exist.
+    
+    The directories are only created on the first call; later calls return
+    without touching the filesystem.
+    """
+    global _DIRS_ENSURED
+    if _DIRS_ENSURED:
+        return
+    os.makedirs(_APP_DATA_DIR_STR, exist_ok=True)
+    _DIRS_ENSURED = True
\ No newline at end of file